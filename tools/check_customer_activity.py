@@ -27,6 +27,13 @@ MINIPASS_ENV_PATH = "/home/kdresdell/minipass_env"
 DEPLOYED_PATH = f"{MINIPASS_ENV_PATH}/deployed"
 NGINX_LOG_PATH = "/var/log/nginx/access.log"
 
+# Probe timeouts (seconds): docker daemon queries should answer almost
+# instantly, docker stats samples for ~2s, external HTTP probes get the
+# most slack. Log scans keep run_command's default.
+DOCKER_PROBE_TIMEOUT = 5
+STATS_PROBE_TIMEOUT = 10
+REMOTE_PROBE_TIMEOUT = 10
+
 # Known customers and their container names
 CUSTOMERS = {
     "lhgi": {
@@ -58,21 +65,29 @@ def log(message: str, level: str = "INFO", color: str = "") -> None:
     else:
         print(f"[{timestamp}] [{level}] {message}")
 
-def run_command(command: str, capture_output: bool = True, timeout: int = 30) -> tuple[bool, str]:
-    """Run a shell command and return success status and output."""
+def run_command(command: str | list, capture_output: bool = True, timeout: int = 30) -> tuple[bool, str]:
+    """Run a command and return success status and output.
+
+    A string is run through the shell (for pipelines); an argv list is
+    executed directly without spawning /bin/sh. Probes inherit our fds
+    rather than paying for a close-all on every spawn; this script holds
+    nothing sensitive open.
+    """
+    shell = isinstance(command, str)
     try:
         if capture_output:
             result = subprocess.run(
                 command,
-                shell=True,
+                shell=shell,
                 capture_output=True,
                 text=True,
-                timeout=timeout
+                timeout=timeout,
+                close_fds=False
             )
             output = result.stdout + result.stderr
             return result.returncode == 0, output.strip()
         else:
-            result = subprocess.run(command, shell=True, timeout=timeout)
+            result = subprocess.run(command, shell=shell, timeout=timeout, close_fds=False)
             return result.returncode == 0, ""
     except subprocess.TimeoutExpired:
         return False, f"Command timed out after {timeout} seconds"
@@ -86,6 +101,7 @@ class ActivityChecker:
         self.debug = debug
         self.timeout_minutes = timeout_minutes
         self.cutoff_time = datetime.now() - timedelta(minutes=timeout_minutes)
+        self._health_codes = {}
 
     def debug_log(self, message: str) -> None:
         """Log debug message if debug mode is enabled."""
@@ -103,12 +119,14 @@ class ActivityChecker:
         container_name = customer_config["container_name"]
 
         # Check if container is running
-        success, output = run_command(f"docker ps --filter name={container_name} --format '{{{{.Names}}}}'")
+        success, output = run_command(["docker", "ps", "--filter", f"name={container_name}", "--format", "{{.Names}}"],
+                                      timeout=DOCKER_PROBE_TIMEOUT)
         if not success or container_name not in output:
             return {"status": "stopped", "message": "Container not running"}
 
         # Get container stats
-        success, stats = run_command(f"docker stats {container_name} --no-stream --format 'table {{{{.CPUPerc}}}},{{{{.MemUsage}}}}'")
+        success, stats = run_command(["docker", "stats", container_name, "--no-stream", "--format", "table {{.CPUPerc}},{{.MemUsage}}"],
+                                     timeout=STATS_PROBE_TIMEOUT)
         if not success:
             return {"error": "Could not get container stats"}
 
@@ -127,8 +145,9 @@ class ActivityChecker:
             memory_usage = "unknown"
 
         # Check active connections
-        success, conn_output = run_command(f"docker exec {container_name} netstat -an 2>/dev/null | grep ESTABLISHED | wc -l")
-        active_connections = int(conn_output) if success and conn_output.isdigit() else 0
+        success, conn_output = run_command(["docker", "exec", container_name, "netstat", "-an"],
+                                          timeout=DOCKER_PROBE_TIMEOUT)
+        active_connections = sum(1 for line in conn_output.split('\n') if 'ESTABLISHED' in line) if success else 0
 
         self.debug_log(f"Docker stats - CPU: {cpu_percent}%, Memory: {memory_usage}, Connections: {active_connections}")
 
@@ -311,6 +330,36 @@ class ActivityChecker:
         except sqlite3.Error as e:
             return {"error": f"Database error: {e}"}
 
+    def prefetch_container_health(self, customers: list) -> None:
+        """Probe all customer domains with a single parallel curl process.
+
+        Results are cached by URL and picked up by check_container_health,
+        which falls back to its own probe when a URL is missing.
+        """
+        urls = [f"https://{CUSTOMERS[c]['domain']}" for c in customers if c in CUSTOMERS]
+        if len(urls) < 2:
+            return
+
+        command = ["curl", "-Z", "-s", "-I", "-m", "5", "-w", "%{url_effective}\\t%{http_code}\\n"]
+        for url in urls:
+            command += ["-o", "/dev/null", url]
+
+        try:
+            result = subprocess.run(command, capture_output=True, text=True,
+                                    timeout=REMOTE_PROBE_TIMEOUT)
+        except (subprocess.TimeoutExpired, OSError) as e:
+            self.debug_log(f"Parallel health probe failed: {e}")
+            return
+
+        # curl exits non-zero if any single transfer failed; the per-URL
+        # status codes on stdout are still valid (000 = no response)
+        for line in result.stdout.splitlines():
+            url, _, code = line.partition('\t')
+            if code:
+                self._health_codes[url.rstrip('/')] = code
+
+        self.debug_log(f"Parallel health probe results: {self._health_codes}")
+
     def check_container_health(self, customer: str) -> dict:
         """Check container health and responsiveness."""
         self.debug_log(f"Checking container health for {customer}")
@@ -321,18 +370,28 @@ class ActivityChecker:
 
         domain = customer_config["domain"]
 
-        # Try to get a quick HTTP response
-        success, output = run_command(
-            f"curl -s -I -m 5 https://{domain} | head -n 1",
-            timeout=10
-        )
+        # Use the status code from the parallel probe if we have one, otherwise
+        # run the same probe for this domain alone
+        code = self._health_codes.get(f"https://{domain}")
+        if code is None:
+            success, output = run_command(
+                ["curl", "-s", "-I", "-o", "/dev/null", "-w", "%{http_code}", "-m", "5", f"https://{domain}"],
+                timeout=REMOTE_PROBE_TIMEOUT
+            )
+            # On a failed transfer curl still prints 000, but a timeout or
+            # spawn error leaves a message in output instead
+            code = output if success else "000"
+
+        return self._health_from_status_code(code)
 
-        if success and "200 OK" in output:
+    def _health_from_status_code(self, code: str) -> dict:
+        """Map a curl %{http_code} to a health status (000 = no response)."""
+        if code == "200":
             health_status = "healthy"
             response_info = "HTTP 200 OK"
-        elif success:
+        elif code != "000":
             health_status = "responding"
-            response_info = output
+            response_info = f"HTTP {code}"
         else:
             health_status = "unreachable"
             response_info = "No response"
@@ -547,6 +606,9 @@ Examples:
 
     all_safe = True
 
+    # Probe all domains at once instead of one curl process per customer
+    checker.prefetch_container_health(customers_to_check)
+
     for customer in customers_to_check:
         result = checker.check_customer_activity(customer)
         results.append(result)
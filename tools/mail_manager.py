@@ -5,6 +5,7 @@ import subprocess
 import getpass
 import shutil
 import pyfiglet
+from functools import lru_cache
 
 # Get the parent directory (minipass_env) from the current script location
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -753,14 +754,19 @@ def deep_mail_server_diagnostics():
 
 
 
+@lru_cache(maxsize=1)
+def menu_title():
+    """Render the menu banner once; pyfiglet reloads its font on every call"""
+    return pyfiglet.figlet_format("minipass", font = "big" )
+
+
 def main_menu():
     while True:
         #print("\n~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
         #print("   MINIPASS MAIL MANGER  TOOL")
         #print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
 
-        title = pyfiglet.figlet_format("minipass", font = "big" ) 
-        print(title)
+        print(menu_title())
 
         print("  1.  List mail users")
         print("  2.  List users with forwarding")
@@ -5,9 +5,11 @@ import sqlite3
 import subprocess
 import shutil
 import sys
+import tempfile
 import json
 import re
 from datetime import datetime
+from functools import cached_property
 from typing import List, Dict, Tuple, Optional
 import pyfiglet
 
@@ -28,6 +30,20 @@ DOMAIN = "minipass.me"
 LOCAL_SIEVE_BASE = os.path.join(PARENT_DIR, "config", "user-patches")
 FORWARD_DIR = os.path.join(PARENT_DIR, "config", "user-patches")
 
+DOCKER_CLEANUP_OPTIONS = """
+🛡️ Safe Docker Cleanup Options:
+1. 🧹 Safe cleanup - Remove unused containers, images, volumes, networks
+   └── Safe for production: Running containers remain untouched
+2. 🚀 Comprehensive cleanup (RECOMMENDED) - Safe cleanup + build cache
+   └── Best balance: Maximum space savings while preserving running services
+3. ⚠️  Emergency cleanup - Aggressive cleanup with build cache reset
+   └── Use only if needed: May impact build performance but preserves running containers
+
+💡 Your running containers will be preserved:
+   • nginx proxy server, mail server, SSL certificate services
+   • Any running MiniPass customer containers
+"""
+
 
 
 
@@ -83,47 +99,78 @@ class MiniPassAppManager:
             
         return customers
     
+    def _docker_json_lines(self, cmd: List[str]) -> List[Dict]:
+        """Stream a docker listing command, parsing each JSON line as it arrives"""
+        items = []
+        try:
+            # stderr goes to a file, not a pipe: docker could otherwise block on
+            # a full stderr pipe while we are still waiting on stdout
+            with tempfile.TemporaryFile(mode='w+') as stderr_file:
+                with subprocess.Popen(['docker'] + cmd, stdout=subprocess.PIPE,
+                                      stderr=stderr_file, text=True,
+                                      bufsize=1 << 16) as proc:
+                    for line in proc.stdout:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            items.append(json.loads(line))
+                        except json.JSONDecodeError:
+                            continue
+                stderr_file.seek(0)
+                stderr = stderr_file.read()
+        except Exception as e:
+            raise Exception(f"Error running docker command: {e}")
+        
+        if proc.returncode != 0:
+            raise Exception(f"Docker command failed: {stderr}")
+        return items
+    
+    @cached_property
+    def _all_containers_json(self) -> List[Dict]:
+        """All containers from `docker ps -a`, fetched once until invalidated"""
+        return self._docker_json_lines(['ps', '-a', '--format', 'json'])
+    
+    @cached_property
+    def _all_images_json(self) -> List[Dict]:
+        """All images from `docker images`, fetched once until invalidated"""
+        return self._docker_json_lines(['images', '--format', 'json'])
+    
+    def invalidate_docker_cache(self):
+        """Drop cached docker listings so the next lookup hits the daemon again"""
+        self.__dict__.pop('_all_containers_json', None)
+        self.__dict__.pop('_all_images_json', None)
+    
     def get_minipass_containers(self) -> List[Dict]:
         """Get all containers created by the website controller"""
         containers = []
         
         try:
-            # Get all containers with format
-            result = self.run_docker_command(['ps', '-a', '--format', 'json'])
-            
-            for line in result.stdout.strip().split('\n'):
-                if not line:
-                    continue
+            for container_data in self._all_containers_json:
+                container_name = container_data.get('Names', '')
+                
+                # Check if container name matches minipass pattern
+                if container_name.startswith("minipass_"):
+                    subdomain = container_name.replace("minipass_", "")
                     
-                try:
-                    container_data = json.loads(line)
-                    container_name = container_data.get('Names', '')
+                    # Get memory usage
+                    memory_usage = self.get_container_memory_usage(container_name)
                     
-                    # Check if container name matches minipass pattern
-                    if container_name.startswith("minipass_"):
-                        subdomain = container_name.replace("minipass_", "")
-                        
-                        # Get memory usage
-                        memory_usage = self.get_container_memory_usage(container_name)
-                        
-                        # Get deployed folder size
-                        deployed_size = self.get_deployed_folder_size(subdomain)
-                        
-                        container_info = {
-                            'name': container_name,
-                            'subdomain': subdomain,
-                            'status': container_data.get('State', 'unknown'),
-                            'image': container_data.get('Image', 'unknown'),
-                            'created': container_data.get('CreatedAt', ''),
-                            'ports': container_data.get('Ports', ''),
-                            'id': container_data.get('ID', '')[:12],
-                            'memory_usage': memory_usage,
-                            'deployed_size': deployed_size
-                        }
-                        containers.append(container_info)
-                        
-                except json.JSONDecodeError:
-                    continue
+                    # Get deployed folder size
+                    deployed_size = self.get_deployed_folder_size(subdomain)
+                    
+                    container_info = {
+                        'name': container_name,
+                        'subdomain': subdomain,
+                        'status': container_data.get('State', 'unknown'),
+                        'image': container_data.get('Image', 'unknown'),
+                        'created': container_data.get('CreatedAt', ''),
+                        'ports': container_data.get('Ports', ''),
+                        'id': container_data.get('ID', '')[:12],
+                        'memory_usage': memory_usage,
+                        'deployed_size': deployed_size
+                    }
+                    containers.append(container_info)
                     
         except Exception as e:
             print(f"❌ Docker error: {e}")
@@ -156,32 +203,21 @@ class MiniPassAppManager:
         images = []
         
         try:
-            # Get all images with format
-            result = self.run_docker_command(['images', '--format', 'json'])
-            
-            for line in result.stdout.strip().split('\n'):
-                if not line:
-                    continue
-                    
-                try:
-                    image_data = json.loads(line)
-                    repository = image_data.get('Repository', '')
-                    tag = image_data.get('Tag', '')
-                    full_tag = f"{repository}:{tag}" if tag != '<none>' else repository
-                    
-                    if repository.endswith("-flask-app"):
-                        subdomain = repository.replace("-flask-app", "")
-                        image_info = {
-                            'tag': full_tag,
-                            'subdomain': subdomain,
-                            'id': image_data.get('ID', '')[:12],
-                            'size': image_data.get('Size', '0B'),
-                            'created': image_data.get('CreatedAt', '')
-                        }
-                        images.append(image_info)
-                        
-                except json.JSONDecodeError:
-                    continue
+            for image_data in self._all_images_json:
+                repository = image_data.get('Repository', '')
+                tag = image_data.get('Tag', '')
+                full_tag = f"{repository}:{tag}" if tag != '<none>' else repository
+                
+                if repository.endswith("-flask-app"):
+                    subdomain = repository.replace("-flask-app", "")
+                    image_info = {
+                        'tag': full_tag,
+                        'subdomain': subdomain,
+                        'id': image_data.get('ID', '')[:12],
+                        'size': image_data.get('Size', '0B'),
+                        'created': image_data.get('CreatedAt', '')
+                    }
+                    images.append(image_info)
                     
         except Exception as e:
             print(f"❌ Docker error getting images: {e}")
@@ -228,27 +264,39 @@ class MiniPassAppManager:
         print(f"{'#':<3} {'Subdomain':<12} {'Status':<10} {'Memory':<12} {'Deployed':<10} {'DB Entry':<8} {'Email':<20}")
         print("=" * 80)
         
+        # First match per subdomain wins, as with a linear search
+        containers_by_subdomain = {}
+        for c in containers:
+            containers_by_subdomain.setdefault(c['subdomain'], c)
+        images_by_subdomain = {}
+        for i in images:
+            images_by_subdomain.setdefault(i['subdomain'], i)
+        
         app_list = []
+        rows = []
         for idx, subdomain in enumerate(sorted(all_subdomains), 1):
             # Check container status
-            container = next((c for c in containers if c['subdomain'] == subdomain), None)
+            container = containers_by_subdomain.get(subdomain)
             container_status = container['status'] if container else 'none'
             
             # Get memory usage
             memory_usage = container['memory_usage'] if container else 'N/A'
             
-            # Get deployed folder size
-            deployed_size = self.format_size(self.get_deployed_folder_size(subdomain))
+            # Get deployed folder size (already measured for apps with a container)
+            if container:
+                deployed_size = self.format_size(container['deployed_size'])
+            else:
+                deployed_size = self.format_size(self.get_deployed_folder_size(subdomain))
             
             # Check image status  
-            image = next((i for i in images if i['subdomain'] == subdomain), None)
+            image = images_by_subdomain.get(subdomain)
             
             # Check DB status
             db_entry = customers.get(subdomain)
             db_status = '✅ Yes' if db_entry else '❌ No'
             email = db_entry['email'][:18] + '..' if db_entry and len(db_entry['email']) > 20 else (db_entry['email'] if db_entry else '-')
             
-            print(f"{idx:<3} {subdomain:<12} {container_status:<10} {memory_usage:<12} {deployed_size:<10} {db_status:<8} {email:<20}")
+            rows.append(f"{idx:<3} {subdomain:<12} {container_status:<10} {memory_usage:<12} {deployed_size:<10} {db_status:<8} {email:<20}")
             
             app_list.append({
                 'subdomain': subdomain,
@@ -257,6 +305,7 @@ class MiniPassAppManager:
                 'db_entry': db_entry
             })
         
+        sys.stdout.write('\n'.join(rows) + '\n')
         return app_list
     
     def comprehensive_app_cleanup(self, subdomain: str) -> bool:
@@ -384,6 +433,9 @@ class MiniPassAppManager:
         except Exception as e:
             print(f"   ⚠️ Warning cleaning dangling images: {e}")
         
+        # Containers and images changed, don't serve stale listings
+        self.invalidate_docker_cache()
+        
         print(f"\n{'✅ Cleanup completed successfully!' if success else '⚠️ Cleanup completed with warnings'}")
         if space_freed > 0:
             print(f"💾 Space freed: {self.format_size(space_freed)}")
@@ -393,14 +445,22 @@ class MiniPassAppManager:
     def get_folder_size(self, folder_path: str) -> int:
         """Calculate total size of a folder"""
         total = 0
-        try:
-            for dirpath, dirnames, filenames in os.walk(folder_path):
-                for filename in filenames:
-                    filepath = os.path.join(dirpath, filename)
-                    if os.path.exists(filepath):
-                        total += os.path.getsize(filepath)
-        except:
-            pass
+        pending = [folder_path]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        # is_dir() uses the dirent type, no stat() needed
+                        if entry.is_dir():
+                            if not entry.is_symlink():
+                                pending.append(entry.path)
+                            continue
+                        try:
+                            total += entry.stat().st_size
+                        except OSError:
+                            continue  # broken symlink or vanished file
+            except OSError:
+                continue  # unreadable or missing directory, like os.walk
         return total
     
     def force_remove_folder(self, folder_path: str):
@@ -420,59 +480,71 @@ class MiniPassAppManager:
             
         print(f"   🗑️ Attempting to remove: {folder_path}")
         
-        # Strategy 1: Standard removal
-        print("   🔧 Strategy 1: Standard removal...", end=" ")
-        if self._try_standard_removal(folder_path):
-            print("✅ Success!")
-            return True
-        print("❌ Failed")
-            
-        # Strategy 2: Permission-based removal with detailed analysis
-        print("   🔧 Strategy 2: Permission fixing...", end=" ")
-        if self._try_permission_based_removal(folder_path):
-            print("✅ Success!")
-            return True
-        print("❌ Failed (permission issues)")
-            
-        # Strategy 3: Attribute-based removal (handle immutable files)
-        print("   🔧 Strategy 3: Attribute removal...", end=" ")
-        if self._try_attribute_based_removal(folder_path):
-            print("✅ Success!")
-            return True
-        print("❌ Failed (attribute issues)")
-            
-        # Strategy 4: Container-based removal (for Docker-created files)
-        print("   🔧 Strategy 4: Container-based removal...", end=" ")
-        if self._try_container_based_removal(folder_path):
-            print("✅ Success!")
-            return True
-        print("❌ Failed (container issues)")
-            
-        # Strategy 5: Sudo-based removal (if available)
-        print("   🔧 Strategy 5: Sudo-based removal...", end=" ")
-        if self._try_sudo_removal(folder_path):
-            print("✅ Success!")
-            return True
-        print("❌ Failed (no sudo access)")
-            
-        # Strategy 6: Process-based cleanup (handle busy files)
-        print("   🔧 Strategy 6: Process-based removal...", end=" ")
-        if self._try_process_based_removal(folder_path):
-            print("✅ Success!")
-            return True
-        print("❌ Failed (busy files)")
+        strategies = [
+            ("Standard removal", self._try_standard_removal, "Failed"),
+            ("Permission fixing", self._try_permission_based_removal, "Failed (permission issues)"),
+            ("Attribute removal", self._try_attribute_based_removal, "Failed (attribute issues)"),
+            ("Container-based removal", self._try_container_based_removal, "Failed (container issues)"),
+            ("Sudo-based removal", self._try_sudo_removal, "Failed (no sudo access)"),
+            ("Process-based removal", self._try_process_based_removal, "Failed (busy files)"),
+        ]
+        
+        # Preflight: strategies 1-3 run as us and cannot touch directories
+        # owned by another user (typically root from a container), so don't
+        # spend full tree walks on them
+        first = 0
+        if self._has_foreign_directories(folder_path):
+            first = 3
+            print("   ⏭️ Preflight: directories owned by another user, skipping strategies 1-3")
+        
+        for number, (label, strategy, failure) in enumerate(strategies[first:], first + 1):
+            print(f"   🔧 Strategy {number}: {label}...", end=" ")
+            if strategy(folder_path):
+                print("✅ Success!")
+                return True
+            print(f"❌ {failure}")
             
-        print(f"   ❌ All 6 removal strategies failed for: {folder_path}")
+        print(f"   ❌ All {len(strategies) - first} removal strategies tried failed for: {folder_path}")
         return False
     
-    def _try_standard_removal(self, folder_path: str) -> bool:
-        """Strategy 1: Standard shutil.rmtree removal"""
+    def _has_foreign_directories(self, folder_path: str) -> bool:
+        """Check whether the folder or its top-level subdirectories are owned by someone else and not writable by us"""
+        uid = os.geteuid()
+        if uid == 0:
+            return False
+        
+        try:
+            dirs = [folder_path]
+            with os.scandir(folder_path) as entries:
+                dirs.extend(entry.path for entry in entries if entry.is_dir(follow_symlinks=False))
+            
+            for path in dirs:
+                if os.stat(path, follow_symlinks=False).st_uid != uid and not os.access(path, os.W_OK):
+                    return True
+        except OSError:
+            return False
+        
+        return False
+    
+    def _rm_rf(self, folder_path: str) -> bool:
+        """Remove a folder tree with native `rm -rf`, falling back to shutil.rmtree if rm is missing"""
+        try:
+            result = subprocess.run(['rm', '-rf', '--', folder_path],
+                                  capture_output=True, check=False)
+            return result.returncode == 0
+        except FileNotFoundError:
+            pass
+        
         try:
             shutil.rmtree(folder_path)
             return True
         except Exception:
             return False
     
+    def _try_standard_removal(self, folder_path: str) -> bool:
+        """Strategy 1: Standard rm -rf removal"""
+        return self._rm_rf(folder_path)
+    
     def _try_permission_based_removal(self, folder_path: str) -> bool:
         """Strategy 2: Fix permissions and retry removal"""
         import stat
@@ -525,22 +597,23 @@ class MiniPassAppManager:
                         error_count += 1
             
             # Try final removal
-            shutil.rmtree(folder_path)
-            return True
+            return self._rm_rf(folder_path)
             
         except Exception:
             return False
     
     def _try_attribute_based_removal(self, folder_path: str) -> bool:
         """Strategy 3: Remove special attributes (immutable, append-only) and retry"""
+        if not shutil.which('chattr'):
+            return False
+        
         try:
             # Use chattr to remove immutable and append-only attributes
             result = subprocess.run(['chattr', '-R', '-i', '-a', folder_path], 
                                   capture_output=True, text=True, check=False)
             
             # Try removal after attribute changes
-            shutil.rmtree(folder_path)
-            return True
+            return self._rm_rf(folder_path)
             
         except FileNotFoundError:
             return False
@@ -549,11 +622,11 @@ class MiniPassAppManager:
     
     def _try_container_based_removal(self, folder_path: str) -> bool:
         """Strategy 4: Use Docker container to remove files with different ownership"""
+        # Check if Docker is available
+        if not shutil.which('docker'):
+            return False
+        
         try:
-            # Check if Docker is available
-            if not hasattr(self, 'check_docker_available'):
-                return False
-                
             # Get absolute path
             abs_path = os.path.abspath(folder_path)
             parent_dir = os.path.dirname(abs_path)
@@ -576,16 +649,12 @@ class MiniPassAppManager:
     
     def _try_sudo_removal(self, folder_path: str) -> bool:
         """Strategy 5: Use sudo for removal if available"""
+        if not shutil.which('sudo'):
+            return False
+        
         try:
-            # Check if sudo is available and user has privileges
-            sudo_check = subprocess.run(['sudo', '-n', 'true'], 
-                                      capture_output=True, check=False)
-            
-            if sudo_check.returncode != 0:
-                return False
-            
-            # Use sudo rm with force
-            result = subprocess.run(['sudo', 'rm', '-rf', folder_path], 
+            # -n makes sudo fail instead of prompting, so no separate privilege probe is needed
+            result = subprocess.run(['sudo', '-n', 'rm', '-rf', '--', folder_path], 
                                   capture_output=True, text=True, check=False)
             
             return result.returncode == 0
@@ -595,6 +664,10 @@ class MiniPassAppManager:
     
     def _try_process_based_removal(self, folder_path: str) -> bool:
         """Strategy 6: Handle busy files by finding and killing processes"""
+        if not shutil.which('lsof'):
+            # Try removal anyway if lsof not available
+            return self._rm_rf(folder_path)
+        
         try:
             # Use lsof to find processes using files in the directory
             result = subprocess.run(['lsof', '+D', folder_path], 
@@ -605,16 +678,8 @@ class MiniPassAppManager:
                 return False
             
             # If no processes found, try removal again
-            shutil.rmtree(folder_path)
-            return True
+            return self._rm_rf(folder_path)
             
-        except FileNotFoundError:
-            # Try removal anyway if lsof not available
-            try:
-                shutil.rmtree(folder_path)
-                return True
-            except:
-                return False
         except Exception:
             return False
     
@@ -624,16 +689,22 @@ class MiniPassAppManager:
             # Check for any backup files or temp files that might contain the subdomain
             deployed_base = os.path.dirname(os.path.join(DEPLOYED_FOLDER, subdomain))
             
-            if os.path.exists(deployed_base):
-                for item in os.listdir(deployed_base):
-                    if subdomain in item and item != subdomain:
-                        item_path = os.path.join(deployed_base, item)
-                        if os.path.isfile(item_path) or os.path.isdir(item_path):
-                            print(f"   🧹 Removing related file/folder: {item}")
-                            if os.path.isdir(item_path):
-                                self.force_remove_folder(item_path)
-                            else:
-                                os.remove(item_path)
+            # One scandir pass: dirent types come back with the listing, no stat() per item
+            try:
+                with os.scandir(deployed_base) as entries:
+                    related = [entry for entry in entries
+                               if subdomain in entry.name and entry.name != subdomain]
+            except FileNotFoundError:
+                related = []
+            
+            for entry in related:
+                is_dir = entry.is_dir()
+                if is_dir or entry.is_file():
+                    print(f"   🧹 Removing related file/folder: {entry.name}")
+                    if is_dir:
+                        self.force_remove_folder(entry.path)
+                    else:
+                        os.remove(entry.path)
         except Exception as e:
             print(f"   ⚠️ Warning cleaning subdomain references: {e}")
     
@@ -816,17 +887,7 @@ class MiniPassAppManager:
                     print(f"   ⚠️ WARNING: {self.format_size(int(reclaimable_before))} of build cache can be cleaned!")
             
             # Simplified cleanup options for production safety
-            print("\n🛡️ Safe Docker Cleanup Options:")
-            print("1. 🧹 Safe cleanup - Remove unused containers, images, volumes, networks")
-            print("   └── Safe for production: Running containers remain untouched")
-            print("2. 🚀 Comprehensive cleanup (RECOMMENDED) - Safe cleanup + build cache")
-            print("   └── Best balance: Maximum space savings while preserving running services")
-            print("3. ⚠️  Emergency cleanup - Aggressive cleanup with build cache reset")
-            print("   └── Use only if needed: May impact build performance but preserves running containers")
-
-            print(f"\n💡 Your running containers will be preserved:")
-            print("   • nginx proxy server, mail server, SSL certificate services")
-            print("   • Any running MiniPass customer containers")
+            sys.stdout.write(DOCKER_CLEANUP_OPTIONS)
 
             cleanup_choice = input("\nChoose cleanup type (1-3) or 'n' to cancel [2 recommended]: ").strip().lower()
             
@@ -963,10 +1024,9 @@ class MiniPassAppManager:
 
                     # Force cleanup of buildkit state
                     print("   🧽 Cleaning buildkit state...")
-                    import subprocess
 
                     # Reset buildkit builder to clear any locked state
-                    result = subprocess.run('docker buildx prune -af', shell=True, capture_output=True, text=True, check=False)
+                    result = self.run_docker_command(['buildx', 'prune', '-af'], check=False)
                     if result.returncode == 0:
                         buildx_freed = self.extract_build_cache_space(result.stdout)
                         if buildx_freed > 0:
@@ -976,7 +1036,7 @@ class MiniPassAppManager:
                             print("     ✅ Buildx state cleaned")
 
                     # Clean up build context cache with timestamp filter
-                    result = subprocess.run('docker builder prune --filter until=1s -f', shell=True, capture_output=True, text=True, check=False)
+                    result = self.run_docker_command(['builder', 'prune', '--filter', 'until=1s', '-f'], check=False)
                     if result.returncode == 0:
                         context_freed = self.extract_build_cache_space(result.stdout)
                         if context_freed > 0:
@@ -1035,6 +1095,7 @@ class MiniPassAppManager:
             
             print("=" * 50)
             print("✅ Docker system cleanup completed!")
+            self.invalidate_docker_cache()
             
             # Enhanced recommendations
             print(f"\n💡 Cleanup Summary:")
@@ -1175,42 +1236,44 @@ class MiniPassAppManager:
                 print("ℹ️ No customer records found in database.")
                 return []
             
-            # Print each record with all fields in a detailed format
+            # Build every record's lines first and write them in one go
+            lines = []
             for idx, row in enumerate(rows, 1):
-                print(f"{'='*80}")
-                print(f"Record #{idx} (Database ID: {row['id']})")
-                print(f"{'='*80}")
+                lines.append(f"{'='*80}")
+                lines.append(f"Record #{idx} (Database ID: {row['id']})")
+                lines.append(f"{'='*80}")
                 
                 # Basic info
-                print(f"🌐 Subdomain:        {row['subdomain']}")
-                print(f"📧 Customer Email:   {row['email']}")
-                print(f"📱 App Name:         {row['app_name']}")
-                print(f"📦 Plan:             {row['plan']}")
-                print(f"🔌 Port:             {row['port']}")
-                print(f"🏢 Organization:     {row['organization_name'] or 'N/A'}")
+                lines.append(f"🌐 Subdomain:        {row['subdomain']}")
+                lines.append(f"📧 Customer Email:   {row['email']}")
+                lines.append(f"📱 App Name:         {row['app_name']}")
+                lines.append(f"📦 Plan:             {row['plan']}")
+                lines.append(f"🔌 Port:             {row['port']}")
+                lines.append(f"🏢 Organization:     {row['organization_name'] or 'N/A'}")
                 
                 # Dates
                 created = self.format_datetime(row['created_at']) if row['created_at'] else 'unknown'
                 email_created = self.format_datetime(row['email_created']) if row['email_created'] else 'N/A'
-                print(f"📅 Created At:       {created}")
-                print(f"📅 Email Created:    {email_created}")
+                lines.append(f"📅 Created At:       {created}")
+                lines.append(f"📅 Email Created:    {email_created}")
                 
                 # Deployment info
                 deployed_status = 'Yes' if row['deployed'] else 'No'
-                print(f"🚀 Deployed:         {deployed_status}")
+                lines.append(f"🚀 Deployed:         {deployed_status}")
                 
                 # Email configuration
-                print(f"📬 App Email:        {row['email_address'] or 'N/A'}")
-                print(f"🔑 Email Password:   {'***SET***' if row['email_password'] else 'N/A'}")
-                print(f"📤 Forwarding Email: {row['forwarding_email'] or 'N/A'}")
-                print(f"✅ Email Status:     {row['email_status'] or 'pending'}")
+                lines.append(f"📬 App Email:        {row['email_address'] or 'N/A'}")
+                lines.append(f"🔑 Email Password:   {'***SET***' if row['email_password'] else 'N/A'}")
+                lines.append(f"📤 Forwarding Email: {row['forwarding_email'] or 'N/A'}")
+                lines.append(f"✅ Email Status:     {row['email_status'] or 'pending'}")
                 
                 # Security info
-                print(f"🔐 Admin Password:   {'***SET***' if row['admin_password'] else 'N/A'}")
+                lines.append(f"🔐 Admin Password:   {'***SET***' if row['admin_password'] else 'N/A'}")
                 
-                print()  # Empty line for readability
+                lines.append('')  # Empty line for readability
             
-            print(f"📊 Total records: {len(rows)}")
+            lines.append(f"📊 Total records: {len(rows)}")
+            sys.stdout.write('\n'.join(lines) + '\n')
             
             # Return structured data for other functions
             records = []
@@ -1304,11 +1367,15 @@ class MiniPassAppManager:
         except Exception as e:
             print(f"❌ Error: {e}")
 
+    @cached_property
+    def _menu_title(self) -> str:
+        """Menu banner, rendered by pyfiglet on first use and reused after"""
+        return pyfiglet.figlet_format("minipass", font = "big" )
+
     def show_menu(self):
         """Display the main menu"""
 
-        title = pyfiglet.figlet_format("minipass", font = "big" ) 
-        print(title)
+        print(self._menu_title)
 
         print("  1.  List all MiniPass applications")
         print("  2.  Delete specific MiniPass application")
@@ -1328,6 +1395,8 @@ class MiniPassAppManager:
     def run(self):
         """Main program loop"""
         while True:
+            # Docker listings are cached per menu action only
+            self.invalidate_docker_cache()
             self.show_menu()
             
             try:
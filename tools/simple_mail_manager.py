@@ -3,6 +3,7 @@
 import os
 import subprocess
 import pyfiglet
+from functools import lru_cache
 
 # Configuration
 MAILSERVER = "mailserver"
@@ -246,10 +247,14 @@ def delete_specific_mailbox():
     except ValueError:
         print("❌ Invalid number.")
 
+@lru_cache(maxsize=1)
+def menu_title():
+    """Menu banner, cached after the first render"""
+    return pyfiglet.figlet_format("simple mail", font="small")
+
 def show_menu():
     """Display the simplified menu"""
-    title = pyfiglet.figlet_format("simple mail", font="small")
-    print(title)
+    print(menu_title())
     print("  1. 📋 List all mailboxes (active + orphaned)")
     print("  2. 🗑️  Delete specific mailbox completely")
     print("  3. 🧹 Clean up ALL orphaned directories")
@@ -23,14 +23,14 @@ import sys
 import subprocess
 import json
 import re
-import csv
-import gzip
-import hashlib
 import secrets
 import time
 import socket
-import ipaddress
 import logging
+import logging.handlers
+import mmap
+import atexit
+import threading
 from datetime import datetime, timedelta
 from collections import defaultdict, Counter
 from pathlib import Path
@@ -39,12 +39,22 @@ import pyfiglet
 import argparse
 
 # Security imports
-from functools import wraps
+from functools import wraps, lru_cache, cached_property
 import signal
 import pwd
 import grp
 
 
+# One fail2ban.log event line: timestamp, [jail], action, IPv4 address.
+# Jail names may contain '-' (postfix-sasl), so [\w-]+ rather than \w+,
+# which would match the "[pid]" field instead.
+FAIL2BAN_EVENT_PATTERN = re.compile(
+    rb'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),\d{3}.*\[([\w-]+)\].*\b(Ban|Unban|Found) (\d+\.\d+\.\d+\.\d+)',
+    re.MULTILINE
+)
+FAIL2BAN_EVENT_KEYS = {b'Ban': 'bans', b'Unban': 'unbans', b'Found': 'attempts'}
+
+
 class SecurityError(Exception):
     """Custom security exception"""
     pass
@@ -83,12 +93,22 @@ class MinimalSecurityAuditor:
         'SECURITY_VIOLATION', 'AUTH_FAILURE', 'COMMAND_TIMEOUT'
     }
     
+    # Events written to disk immediately instead of waiting for the buffer
+    IMMEDIATE_FLUSH_EVENTS = {'SECURITY_VIOLATION', 'AUTH_FAILURE'}
+    
+    # Number of buffered audit records before a write to disk
+    BUFFER_CAPACITY = 64
+    
+    # Seconds a buffered record may wait before the background flusher writes it
+    FLUSH_INTERVAL = 5.0
+    
     def __init__(self, log_file: str = "/home/kdresdell/minipass_env/simplified_fail2ban_manager.log"):
         self.log_file = Path(log_file)
         self.session_id = self._generate_session_id()
         self.start_time = datetime.now()
         self.user = pwd.getpwuid(os.getuid()).pw_name
         self.event_count = 0
+        self._flush_stop = threading.Event()
         
         # Setup minimal logging
         self._setup_minimal_logging()
@@ -118,13 +138,24 @@ class MinimalSecurityAuditor:
                 self.logger.removeHandler(handler)
             
             # Create minimal file handler
-            handler = logging.FileHandler(self.log_file, mode='a')
-            handler.setLevel(logging.CRITICAL)
+            self._file_handler = logging.FileHandler(self.log_file, mode='a')
+            self._file_handler.setLevel(logging.CRITICAL)
             
             # Minimal formatter to save space
             formatter = logging.Formatter('%(asctime)s [%(session)s] %(message)s')
-            handler.setFormatter(formatter)
+            self._file_handler.setFormatter(formatter)
+            
+            # Buffer records in memory so each event isn't its own write();
+            # flushLevel above CRITICAL means only capacity/flush() trigger writes
+            handler = logging.handlers.MemoryHandler(
+                capacity=self.BUFFER_CAPACITY,
+                flushLevel=logging.CRITICAL + 1,
+                target=self._file_handler,
+                flushOnClose=True
+            )
             self.logger.addHandler(handler)
+            atexit.register(self.flush)
+            threading.Thread(target=self._flush_periodically, name='audit-flush', daemon=True).start()
             
             # Set secure permissions on log file
             try:
@@ -137,8 +168,26 @@ class MinimalSecurityAuditor:
             self.logger = None
             self.log_file = None
     
+    def flush(self):
+        """Write any buffered audit records to disk"""
+        if not self.logger:
+            return
+        
+        for handler in self.logger.handlers[:]:
+            try:
+                handler.flush()
+            except Exception:
+                pass
+    
+    def _flush_periodically(self):
+        """Flush the audit buffer every FLUSH_INTERVAL until the session ends"""
+        while not self._flush_stop.wait(self.FLUSH_INTERVAL):
+            self.flush()
+    
     def _check_and_cleanup_audit_log(self):
         """Check audit log size and cleanup if needed"""
+        self.flush()
+        
         if not self.log_file or not self.log_file.exists():
             return
         
@@ -192,6 +241,9 @@ class MinimalSecurityAuditor:
             self.logger.critical(message, extra=extra)
             self.event_count += 1
             
+            if event_type in self.IMMEDIATE_FLUSH_EVENTS:
+                self.flush()
+            
             # Aggressive cleanup after every 50 events
             if self.event_count % 50 == 0:
                 self._check_and_cleanup_audit_log()
@@ -205,24 +257,40 @@ class MinimalSecurityAuditor:
         self.log_critical_event("SESSION_END", f"Duration: {duration}")
         
         # Final audit log cleanup
+        self._flush_stop.set()
         self._check_and_cleanup_audit_log()
         
-        # Close logging handlers to release resources
+        # Close logging handlers to release resources (flushes the buffer)
         if self.logger:
             for handler in self.logger.handlers[:]:
                 handler.close()
                 self.logger.removeHandler(handler)
+            self._file_handler.close()
 
 
 class InputValidator:
     """Streamlined input validation"""
     
+    # Dotted-quad IPv4 without leading zeros, as ipaddress accepts it
+    _IPV4_OCTET = r'(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)'
+    IPV4_PATTERN = re.compile(rf'{_IPV4_OCTET}(?:\.{_IPV4_OCTET}){{3}}')
+    JAIL_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9_-]+$')
+    FILENAME_PATTERN = re.compile(r'^[a-zA-Z0-9_.-]+$')
+    
+    # Shell metacharacters and line breaks removed from command arguments
+    DANGEROUS_CHARS_TABLE = str.maketrans('', '', '`$|&;()<>\n\r')
+    
     @staticmethod
     def validate_ip(ip_string: str) -> bool:
         """Validate IP address format"""
         if not ip_string or len(ip_string) > 45:
             return False
         
+        # Fast path for plain IPv4; anything else (IPv6, garbage) goes to ipaddress
+        if InputValidator.IPV4_PATTERN.fullmatch(ip_string.strip()):
+            return True
+        
+        import ipaddress
         try:
             ipaddress.ip_address(ip_string.strip())
             return True
@@ -235,8 +303,7 @@ class InputValidator:
         if not jail_name or len(jail_name) > 50:
             return False
         
-        pattern = re.compile(r'^[a-zA-Z0-9_-]+$')
-        return bool(pattern.match(jail_name))
+        return bool(InputValidator.JAIL_NAME_PATTERN.match(jail_name))
     
     @staticmethod
     def validate_filename(filename: str) -> bool:
@@ -247,8 +314,7 @@ class InputValidator:
         if '..' in filename or '/' in filename or '\\' in filename:
             return False
         
-        pattern = re.compile(r'^[a-zA-Z0-9_.-]+$')
-        return bool(pattern.match(filename))
+        return bool(InputValidator.FILENAME_PATTERN.match(filename))
     
     @staticmethod
     def validate_time_period(days: str) -> int:
@@ -264,11 +330,13 @@ class InputValidator:
     @staticmethod
     def sanitize_command_arg(arg: str) -> str:
         """Sanitize command arguments"""
-        dangerous_chars = ['`', '$', '|', '&', ';', '(', ')', '<', '>', '\n', '\r']
-        sanitized = arg
-        for char in dangerous_chars:
-            sanitized = sanitized.replace(char, '')
-        return sanitized.strip()
+        return arg.translate(InputValidator.DANGEROUS_CHARS_TABLE).strip()
+
+
+@lru_cache(maxsize=1)
+def _process_group_names() -> frozenset:
+    """Resolve the process's group names once; they cannot change while it runs"""
+    return frozenset(grp.getgrgid(gid).gr_name for gid in os.getgroups())
 
 
 def require_auth(func):
@@ -276,7 +344,7 @@ def require_auth(func):
     @wraps(func)
     def wrapper(self, *args, **kwargs):
         try:
-            user_groups = [grp.getgrgid(gid).gr_name for gid in os.getgroups()]
+            user_groups = _process_group_names()
             if 'sudo' not in user_groups and 'admin' not in user_groups:
                 raise SecurityError("User not authorized for fail2ban operations")
         except Exception as e:
@@ -308,6 +376,92 @@ class SimplifiedFail2BanManager:
     POSTFIX_LOG = "/var/log/mail.log"
     DOVECOT_LOG = "/var/log/dovecot.log"
     
+    # Jail categorization table: (keywords, category), first match wins;
+    # jails matching no rule fall in DEFAULT_JAIL_TYPE
+    JAIL_TYPE_RULES = (
+        (('mail', 'smtp', 'imap', 'pop', 'postfix', 'dovecot'), 'email'),
+        (('ssh',), 'ssh'),
+        (('ftp',), 'ftp'),
+    )
+    DEFAULT_JAIL_TYPE = 'other'
+    
+    # Display icon per jail category
+    JAIL_TYPE_ICONS = {
+        'email': "📧",
+        'ssh': "🔑",
+        'ftp': "📁",
+        'other': "🌐",
+    }
+    
+    # Jails counted by the email security statistics
+    EMAIL_JAILS = frozenset({
+        'postfix-sasl', 'postfix-rbl', 'postfix-relay', 'postfix-spam',
+        'dovecot', 'courier-smtp', 'courier-auth', 'cyrus-imap',
+        'exim', 'exim-spam'
+    })
+    
+    # Queries every jail given as a positional argument inside one container
+    # exec; each jail's output is preceded by "@@jail <name> <exit code>"
+    JAIL_STATUS_BATCH_SCRIPT = (
+        'for jail do '
+        'out=$(fail2ban-client status "$jail" 2>&1); '
+        'echo "@@jail $jail $?"; '
+        'printf "%s\\n" "$out"; '
+        'done'
+    )
+    
+    # Lines read per log file, to bound memory on huge logs
+    MAX_LOG_LINES = 50000
+    
+    # Read size for streamed (compressed or piped) logs
+    LOG_READ_BUFFER_SIZE = 128 * 1024
+    
+    # Write buffer for CSV exports, so large exports take a few dozen write() calls
+    EXPORT_WRITE_BUFFER_SIZE = 1 << 20
+    
+    # Seconds a parsed log window is reused for narrower or equal windows
+    LOG_CACHE_TTL = 60
+    
+    # Seconds a fail2ban status answer is reused within one menu action
+    STATUS_CACHE_TTL = 2.0
+    
+    # Main menu: choice -> handler method name ('x' exits and is handled by run())
+    MENU_ACTIONS = {
+        '1': 'show_jail_status_overview',
+        '2': 'show_banned_ips_detailed',
+        '3': 'unban_ip_interactive',
+        '4': 'ban_ip_interactive',
+        '5': 'show_daily_report',
+        '6': 'search_ip_interactive',
+        '7': 'show_lightweight_email_security_report',
+        '8': 'export_data_interactive',
+        's': 'show_security_audit_log',
+        'd': 'debug_jail_status',
+    }
+    MENU_TEXT = (
+        "🛡️ Simplified Secure Fail2Ban Manager v3.0 - Production Safe\n"
+        + "=" * 60 + "\n"
+        "\n"
+        "  1.  Show jail status overview\n"
+        "  2.  List all banned IPs\n"
+        "  3.  Unban specific IP\n"
+        "  4.  Ban specific IP manually\n"
+        "  5.  Daily/Weekly security activity report\n"
+        "  6.  Search IP across logs\n"
+        "  7.  📧 Lightweight Email Security Report\n"
+        "  8.  Export ban data to CSV\n"
+        "  s.  Show security audit log\n"
+        "  d.  Debug jail status\n"
+        "\n"
+        "  x.  Exit and cleanup session\n"
+        "\n"
+        "🔒 Security: Minimal logging, aggressive cleanup\n"
+        "\n"
+    )
+    MENU_CHOICES = frozenset(MENU_ACTIONS) | {'x'}
+    # Actions whose SecurityError is reported as a restriction rather than a violation
+    RESTRICTED_MENU_ACTIONS = frozenset({'3', '4', '8'})
+    
     # Rate limiters
     COMMAND_RATE_LIMITER = RateLimiter(max_calls=20, time_window=60)
     UNBAN_RATE_LIMITER = RateLimiter(max_calls=5, time_window=300)
@@ -317,6 +471,9 @@ class SimplifiedFail2BanManager:
         """Initialize simplified fail2ban manager"""
         self.auditor = MinimalSecurityAuditor()
         self.validator = InputValidator()
+        self._status_cache = {}
+        self._log_cache = None  # (days, parsed_at, log_mtime, log_data) of the last log parse
+        self._jail_names = {}  # raw jail bytes from the log -> interned name, or None if invalid
         
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -324,11 +481,24 @@ class SimplifiedFail2BanManager:
         
         try:
             self._check_security_prerequisites()
-            self._check_fail2ban_available()
         except Exception as e:
             self.auditor.log_critical_event("INIT_FAILURE", f"Initialization failed: {e}")
             raise
     
+    @classmethod
+    def _jail_type(cls, jail_name: str) -> str:
+        """Return the category of a jail based on JAIL_TYPE_RULES"""
+        jail_lower = jail_name.lower()
+        for keywords, jail_type in cls.JAIL_TYPE_RULES:
+            if any(keyword in jail_lower for keyword in keywords):
+                return jail_type
+        return cls.DEFAULT_JAIL_TYPE
+    
+    @classmethod
+    def _jail_type_icon(cls, jail_name: str) -> str:
+        """Return the display icon for a jail's category"""
+        return cls.JAIL_TYPE_ICONS[cls._jail_type(jail_name)]
+    
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals gracefully"""
         self.auditor.cleanup_session()
@@ -345,22 +515,6 @@ class SimplifiedFail2BanManager:
         if not os.access(self.FAIL2BAN_CLIENT, os.X_OK):
             raise SecurityError("fail2ban-client not executable")
     
-    def _check_fail2ban_available(self):
-        """Check if fail2ban is available"""
-        try:
-            result = subprocess.run(
-                ['which', 'fail2ban-client'], 
-                capture_output=True, 
-                text=True,
-                timeout=5
-            )
-            if result.returncode != 0:
-                raise SecurityError("fail2ban-client not available in PATH")
-        except subprocess.TimeoutExpired:
-            raise SecurityError("fail2ban-client check timed out")
-        except Exception as e:
-            raise SecurityError(f"Fail2ban availability check failed: {e}")
-    
     @require_auth
     @rate_limit(COMMAND_RATE_LIMITER)
     def _run_fail2ban_command(self, cmd_args: List[str], check: bool = True) -> subprocess.CompletedProcess:
@@ -403,8 +557,53 @@ class SimplifiedFail2BanManager:
         except Exception as e:
             raise SecurityError(f"Error running fail2ban command: {e}")
     
+    @require_auth
+    @rate_limit(COMMAND_RATE_LIMITER)
+    def _run_jail_status_batch(self, jail_names: List[str]) -> subprocess.CompletedProcess:
+        """Run `fail2ban-client status <jail>` for several jails in one docker exec"""
+        for jail_name in jail_names:
+            if not self.validator.validate_jail_name(jail_name):
+                raise SecurityError(f"Invalid jail name: {jail_name}")
+        
+        command = ['docker', 'exec', 'mailserver', 'sh', '-c',
+                   self.JAIL_STATUS_BATCH_SCRIPT, 'sh'] + list(jail_names)
+        
+        try:
+            return subprocess.run(
+                command,
+                capture_output=True,
+                text=True,
+                check=False,
+                timeout=30,
+                env={'PATH': '/usr/bin:/bin'}
+            )
+        except subprocess.TimeoutExpired:
+            self.auditor.log_critical_event("COMMAND_TIMEOUT", f"Command timed out: {' '.join(command[:3])}")
+            raise SecurityError("Command execution timed out")
+        except Exception as e:
+            raise SecurityError(f"Error running fail2ban command: {e}")
+    
+    def _get_cached_status(self, key):
+        """Return a cached fail2ban answer younger than STATUS_CACHE_TTL, else None"""
+        entry = self._status_cache.get(key)
+        if entry and time.monotonic() - entry[0] < self.STATUS_CACHE_TTL:
+            return entry[1]
+        return None
+    
+    def _set_cached_status(self, key, value):
+        """Cache a fail2ban answer with the current time"""
+        self._status_cache[key] = (time.monotonic(), value)
+    
+    def invalidate_status_cache(self):
+        """Forget cached jail answers after a ban or unban changed them"""
+        self._status_cache.clear()
+    
     def get_active_jails(self) -> List[str]:
         """Get list of active jails"""
+        cached = self._get_cached_status('jails')
+        if cached is not None:
+            return list(cached)
+        
         try:
             result = self._run_fail2ban_command(['status'])
             if result.returncode == 0:
@@ -424,7 +623,9 @@ class SimplifiedFail2BanManager:
                         for jail in jails:
                             if self.validator.validate_jail_name(jail):
                                 validated_jails.append(jail)
-                        return validated_jails
+                        self._set_cached_status('jails', validated_jails)
+                        return list(validated_jails)
+                self._set_cached_status('jails', [])
                 return []
             else:
                 return []
@@ -436,70 +637,109 @@ class SimplifiedFail2BanManager:
         if not self.validator.validate_jail_name(jail_name):
             raise SecurityError(f"Invalid jail name: {jail_name}")
         
+        cached = self._get_cached_status(('status', jail_name))
+        if cached is not None:
+            return cached
+        
         try:
             result = self._run_fail2ban_command(['status', jail_name])
             if result.returncode == 0:
-                status_info = {
-                    'filter': 'unknown',
-                    'actions': 'unknown', 
-                    'currently_failed': 0,
-                    'total_failed': 0,
-                    'currently_banned': 0,
-                    'total_banned': 0,
-                    'banned_ips': []
-                }
-                
-                lines = result.stdout.split('\n')
-                for line in lines:
-                    line = line.strip()
-                    if not line or ':' not in line:
-                        continue
-                    
-                    try:
-                        if 'Filter' in line:
-                            parts = line.split(':', 1)
-                            if len(parts) >= 2:
-                                status_info['filter'] = parts[1].strip()[:100]
-                        elif 'Actions' in line:
-                            parts = line.split(':', 1)
-                            if len(parts) >= 2:
-                                status_info['actions'] = parts[1].strip()[:100]
-                        elif 'Currently failed' in line:
-                            parts = line.split(':', 1)
-                            if len(parts) >= 2:
-                                status_info['currently_failed'] = max(0, int(parts[1].strip()))
-                        elif 'Total failed' in line:
-                            parts = line.split(':', 1)
-                            if len(parts) >= 2:
-                                status_info['total_failed'] = max(0, int(parts[1].strip()))
-                        elif 'Currently banned' in line:
-                            parts = line.split(':', 1)
-                            if len(parts) >= 2:
-                                status_info['currently_banned'] = max(0, int(parts[1].strip()))
-                        elif 'Total banned' in line:
-                            parts = line.split(':', 1)
-                            if len(parts) >= 2:
-                                status_info['total_banned'] = max(0, int(parts[1].strip()))
-                        elif 'Banned IP list' in line:
-                            parts = line.split(':', 1)
-                            if len(parts) >= 2:
-                                ip_list = parts[1].strip()
-                                if ip_list:
-                                    ips = [ip.strip() for ip in ip_list.split()]
-                                    validated_ips = []
-                                    for ip in ips:
-                                        if self.validator.validate_ip(ip):
-                                            validated_ips.append(ip)
-                                    status_info['banned_ips'] = validated_ips
-                    except (ValueError, IndexError):
-                        continue
-                
+                status_info = self._parse_jail_status(result.stdout)
+                self._set_cached_status(('status', jail_name), status_info)
                 return status_info
             else:
                 return None
         except Exception:
             return None
     
+    def get_jail_statuses(self, jail_names: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Get detailed status for several jails with a single fail2ban round trip"""
+        statuses = {jail: self._get_cached_status(('status', jail)) for jail in jail_names}
+        missing = [jail for jail, status in statuses.items() if status is None]
+        if not missing:
+            return statuses
+        
+        try:
+            result = self._run_jail_status_batch(missing)
+        except Exception:
+            return statuses
+        
+        sections = {}
+        current = None
+        for line in result.stdout.split('\n'):
+            if line.startswith('@@jail '):
+                parts = line.split()
+                if len(parts) == 3 and parts[1] in missing and parts[2] == '0':
+                    current = sections.setdefault(parts[1], [])
+                else:
+                    current = None
+            elif current is not None:
+                current.append(line)
+        
+        for jail, lines in sections.items():
+            statuses[jail] = self._parse_jail_status('\n'.join(lines))
+            self._set_cached_status(('status', jail), statuses[jail])
+        return statuses
+    
+    def _parse_jail_status(self, output: str) -> Dict[str, Any]:
+        """Parse the output of `fail2ban-client status <jail>`"""
+        status_info = {
+            'filter': 'unknown',
+            'actions': 'unknown', 
+            'currently_failed': 0,
+            'total_failed': 0,
+            'currently_banned': 0,
+            'total_banned': 0,
+            'banned_ips': []
+        }
+        
+        lines = output.split('\n')
+        for line in lines:
+            line = line.strip()
+            if not line or ':' not in line:
+                continue
+            
+            try:
+                if 'Filter' in line:
+                    parts = line.split(':', 1)
+                    if len(parts) >= 2:
+                        status_info['filter'] = parts[1].strip()[:100]
+                elif 'Actions' in line:
+                    parts = line.split(':', 1)
+                    if len(parts) >= 2:
+                        status_info['actions'] = parts[1].strip()[:100]
+                elif 'Currently failed' in line:
+                    parts = line.split(':', 1)
+                    if len(parts) >= 2:
+                        status_info['currently_failed'] = max(0, int(parts[1].strip()))
+                elif 'Total failed' in line:
+                    parts = line.split(':', 1)
+                    if len(parts) >= 2:
+                        status_info['total_failed'] = max(0, int(parts[1].strip()))
+                elif 'Currently banned' in line:
+                    parts = line.split(':', 1)
+                    if len(parts) >= 2:
+                        status_info['currently_banned'] = max(0, int(parts[1].strip()))
+                elif 'Total banned' in line:
+                    parts = line.split(':', 1)
+                    if len(parts) >= 2:
+                        status_info['total_banned'] = max(0, int(parts[1].strip()))
+                elif 'Banned IP list' in line:
+                    parts = line.split(':', 1)
+                    if len(parts) >= 2:
+                        ip_list = parts[1].strip()
+                        if ip_list:
+                            ips = [ip.strip() for ip in ip_list.split()]
+                            validated_ips = []
+                            for ip in ips:
+                                if self.validator.validate_ip(ip):
+                                    validated_ips.append(ip)
+                            status_info['banned_ips'] = validated_ips
+            except (ValueError, IndexError):
+                continue
+        
+        return status_info
+    
     @rate_limit(UNBAN_RATE_LIMITER)
     def unban_ip(self, jail_name: str, ip_address: str) -> bool:
         """Unban a specific IP from a jail"""
@@ -513,6 +753,7 @@ class SimplifiedFail2BanManager:
             # Try global unban first
             result = self._run_fail2ban_command(['unban', ip_address], check=False)
             if result.returncode == 0:
+                self.invalidate_status_cache()
                 self.auditor.log_critical_event("UNBAN_SUCCESS", f"Global unban - IP: {ip_address}")
                 print(f"✅ Successfully unbanned {ip_address}")
                 return True
@@ -520,6 +761,7 @@ class SimplifiedFail2BanManager:
                 # Try jail-specific unban
                 result = self._run_fail2ban_command(['set', jail_name, 'unbanip', ip_address], check=False)
                 if result.returncode == 0:
+                    self.invalidate_status_cache()
                     self.auditor.log_critical_event("UNBAN_SUCCESS", f"Jail: {jail_name}, IP: {ip_address}")
                     print(f"✅ Successfully unbanned {ip_address} from {jail_name}")
                     return True
@@ -540,6 +782,7 @@ class SimplifiedFail2BanManager:
             raise SecurityError(f"Invalid IP address: {ip_address}")
         
         # Security check for private/localhost
+        import ipaddress
         try:
             ip = ipaddress.ip_address(ip_address)
             if ip.is_private or ip.is_loopback:
@@ -552,6 +795,7 @@ class SimplifiedFail2BanManager:
         try:
             result = self._run_fail2ban_command(['set', jail_name, 'banip', ip_address])
             if result.returncode == 0:
+                self.invalidate_status_cache()
                 self.auditor.log_critical_event("BAN_SUCCESS", f"Jail: {jail_name}, IP: {ip_address}")
                 print(f"✅ Successfully banned {ip_address} in {jail_name}")
                 if clean_reason:
@@ -569,141 +813,219 @@ class SimplifiedFail2BanManager:
         if not isinstance(days, int) or days < 1 or days > 90:
             raise SecurityError("Invalid days parameter")
         
-        log_data = {
-            'bans': [],
-            'unbans': [],
-            'attempts': []
-        }
-        
         cutoff_date = datetime.now() - timedelta(days=days)
         
+        # A recent parse of an equal or wider window already holds every event we
+        # need, unless fail2ban has written to its log since
+        try:
+            log_mtime = os.stat(self.FAIL2BAN_LOG).st_mtime_ns
+        except OSError:
+            log_mtime = None
+        if self._log_cache is not None:
+            cached_days, parsed_at, cached_mtime, cached_data = self._log_cache
+            if (cached_days >= days and cached_mtime == log_mtime
+                    and time.monotonic() - parsed_at < self.LOG_CACHE_TTL):
+                return self._slice_log_data(cached_data, cutoff_date)
+        
+        log_data = self._empty_log_data()
+        
         # Limit to main log file only for performance
         log_files = [self.FAIL2BAN_LOG]
         
-        # Add only recent rotated logs (limit to 2 files)
+        # Add only recent rotated logs (limit to 2 files). A rotated file last
+        # written before the cutoff holds nothing in range, so skip it unopened.
+        cutoff_ts = cutoff_date.timestamp()
         for i in range(1, min(3, days + 1)):
-            log_file = f"{self.FAIL2BAN_LOG}.{i}"
-            if os.path.exists(log_file):
-                log_files.append(log_file)
-                break  # Only add first rotated file
+            # logrotate leaves either fail2ban.log.N or, without delaycompress, fail2ban.log.N.gz
+            for log_file in (f"{self.FAIL2BAN_LOG}.{i}", f"{self.FAIL2BAN_LOG}.{i}.gz"):
+                try:
+                    mtime = os.stat(log_file).st_mtime
+                except OSError:
+                    continue
+                if mtime >= cutoff_ts:
+                    log_files.append(log_file)
+                break
+            else:
+                continue
+            break  # Only add first rotated file
         
         for log_file in log_files:
             try:
                 if log_file.endswith('.gz'):
-                    with gzip.open(log_file, 'rt', encoding='utf-8', errors='ignore') as f:
-                        self._parse_log_content_minimal(f, log_data, cutoff_date)
+                    try:
+                        # zgrep decompresses in C in its own process and drops the
+                        # non-event lines before Python sees them
+                        with subprocess.Popen(
+                            ['zgrep', '-hE', r'(Ban|Unban|Found) [0-9]', '--', log_file],
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.DEVNULL,
+                            bufsize=1 << 20
+                        ) as proc:
+                            self._parse_log_content_minimal(self._iter_log_lines(proc.stdout), log_data, cutoff_date)
+                            proc.kill()
+                    except FileNotFoundError:
+                        import gzip
+                        with gzip.open(log_file, 'rb') as f:
+                            self._parse_log_content_minimal(self._iter_log_lines(f), log_data, cutoff_date)
                 else:
                     try:
-                        with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                            self._parse_log_content_minimal(f, log_data, cutoff_date)
+                        with open(log_file, 'rb') as f:
+                            if os.fstat(f.fileno()).st_size:
+                                # Scan the mapped pages directly instead of allocating a bytes object per line
+                                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                                    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                                        # One front-to-back scan: let the kernel read ahead
+                                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                                    self._parse_mapped_log_minimal(mm, log_data, cutoff_date)
                     except PermissionError:
                         # Try with sudo
                         try:
-                            result = subprocess.run(
-                                ['sudo', '-n', 'cat', log_file], 
-                                capture_output=True, 
-                                text=True, 
-                                check=True,
-                                timeout=30
-                            )
-                            from io import StringIO
-                            self._parse_log_content_minimal(StringIO(result.stdout), log_data, cutoff_date)
+                            # Stream the pipe instead of buffering the whole log in memory
+                            with subprocess.Popen(
+                                ['sudo', '-n', 'cat', log_file],
+                                stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL,
+                                bufsize=1 << 20
+                            ) as proc:
+                                self._parse_log_content_minimal(self._iter_log_lines(proc.stdout), log_data, cutoff_date)
+                                # The parser may stop early at its line cap
+                                proc.kill()
                         except:
                             continue
             except Exception:
                 continue
         
+        self._log_cache = (days, time.monotonic(), log_mtime, log_data)
         return log_data
     
+    @staticmethod
+    def _empty_log_data() -> Dict[str, Any]:
+        """Return an empty parse result"""
+        return {
+            'bans': [],
+            'unbans': [],
+            'attempts': [],
+            # Same events indexed by IP: {ip: {'bans': [...], 'unbans': [...], 'attempts': [...]}}
+            'by_ip': {}
+        }
+    
+    def _slice_log_data(self, log_data: Dict[str, Any], cutoff_date: datetime) -> Dict[str, Any]:
+        """Return the events of a parse result that are not older than cutoff_date"""
+        sliced = self._empty_log_data()
+        for key in ('bans', 'unbans', 'attempts'):
+            for event in log_data[key]:
+                if event['timestamp'] < cutoff_date:
+                    continue
+                sliced[key].append(event)
+                ip_events = sliced['by_ip'].get(event['ip'])
+                if ip_events is None:
+                    ip_events = sliced['by_ip'][event['ip']] = {'bans': [], 'unbans': [], 'attempts': []}
+                ip_events[key].append(event)
+        return sliced
+    
+    def _iter_log_lines(self, stream):
+        """Yield lines from a binary stream, reading large chunks and splitting them in C"""
+        tail = b''
+        while True:
+            chunk = stream.read(self.LOG_READ_BUFFER_SIZE)
+            if not chunk:
+                break
+            lines = (tail + chunk).split(b'\n')
+            tail = lines.pop()
+            yield from lines
+        if tail:
+            yield tail
+    
     def _parse_log_content_minimal(self, file_handle, log_data: Dict, cutoff_date: datetime):
-        """Parse log content with minimal processing and no individual line logging"""
-        ban_pattern = re.compile(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}).*\[(\w+)\].*Ban (\d+\.\d+\.\d+\.\d+)')
-        unban_pattern = re.compile(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}).*\[(\w+)\].*Unban (\d+\.\d+\.\d+\.\d+)')
-        attempt_pattern = re.compile(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}).*\[(\w+)\].*Found (\d+\.\d+\.\d+\.\d+)')
-        
+        """Parse log content with minimal processing and no individual line logging
+
+        file_handle yields raw bytes lines; only matched fields are decoded.
+        """
         line_count = 0
-        processed_events = 0
+        # Fixed-width ISO timestamps order the same as bytes as they do as times
+        cutoff_raw = cutoff_date.strftime('%Y-%m-%d %H:%M:%S').encode('ascii')
         
         for line in file_handle:
             line_count += 1
             
             # Aggressive limit to prevent memory issues
-            if line_count > 50000:  # Reduced from 100000
+            if line_count > self.MAX_LOG_LINES:
                 break
             
-            try:
-                # Parse timestamp
-                timestamp_match = re.match(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})', line)
-                if not timestamp_match:
-                    continue
-                
-                timestamp_str = timestamp_match.group(1)
-                timestamp = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
-                
-                if timestamp < cutoff_date:
-                    continue
-                
-                # Check for ban events
-                ban_match = ban_pattern.search(line)
-                if ban_match:
-                    jail = ban_match.group(2)
-                    ip = ban_match.group(3)
-                    
-                    if self.validator.validate_jail_name(jail) and self.validator.validate_ip(ip):
-                        log_data['bans'].append({
-                            'timestamp': timestamp,
-                            'jail': jail,
-                            'ip': ip
-                        })
-                        processed_events += 1
-                    continue
-                
-                # Check for unban events
-                unban_match = unban_pattern.search(line)
-                if unban_match:
-                    jail = unban_match.group(2)
-                    ip = unban_match.group(3)
-                    
-                    if self.validator.validate_jail_name(jail) and self.validator.validate_ip(ip):
-                        log_data['unbans'].append({
-                            'timestamp': timestamp,
-                            'jail': jail,
-                            'ip': ip
-                        })
-                        processed_events += 1
-                    continue
-                
-                # Check for attempt events
-                attempt_match = attempt_pattern.search(line)
-                if attempt_match:
-                    jail = attempt_match.group(2)
-                    ip = attempt_match.group(3)
-                    
-                    if self.validator.validate_jail_name(jail) and self.validator.validate_ip(ip):
-                        log_data['attempts'].append({
-                            'timestamp': timestamp,
-                            'jail': jail,
-                            'ip': ip
-                        })
-                        processed_events += 1
-                        
-            except Exception:
+            # Cheap substring reject before the regex; most lines are not events
+            if b'Ban ' not in line and b'Unban ' not in line and b'Found ' not in line:
                 continue
+            
+            match = FAIL2BAN_EVENT_PATTERN.match(line)
+            if match:
+                self._record_log_event(match, log_data, cutoff_raw)
         
         # No individual line logging - only summary if it's significant
         # (This dramatically reduces log volume)
     
+    def _parse_mapped_log_minimal(self, buffer, log_data: Dict, cutoff_date: datetime):
+        """Parse a memory-mapped log with finditer, honouring the same line cap"""
+        cutoff_raw = cutoff_date.strftime('%Y-%m-%d %H:%M:%S').encode('ascii')
+        
+        # Offset just past line MAX_LOG_LINES (or the end of the buffer)
+        end = 0
+        for _ in range(self.MAX_LOG_LINES):
+            newline = buffer.find(b'\n', end)
+            if newline == -1:
+                end = len(buffer)
+                break
+            end = newline + 1
+        
+        for match in FAIL2BAN_EVENT_PATTERN.finditer(buffer, 0, end):
+            self._record_log_event(match, log_data, cutoff_raw)
+    
+    def _record_log_event(self, match, log_data: Dict, cutoff_raw: bytes):
+        """Append one matched log event to log_data if it is inside the window"""
+        try:
+            timestamp_raw, jail_raw, action, ip_raw = match.groups()
+            if timestamp_raw < cutoff_raw:
+                return
+            
+            timestamp = datetime(
+                int(timestamp_raw[0:4]), int(timestamp_raw[5:7]), int(timestamp_raw[8:10]),
+                int(timestamp_raw[11:13]), int(timestamp_raw[14:16]), int(timestamp_raw[17:19])
+            )
+            # A handful of jails repeat on every line: validate each once and
+            # share one string object between all of its events
+            try:
+                jail = self._jail_names[jail_raw]
+            except KeyError:
+                jail = jail_raw.decode('ascii')
+                jail = self._jail_names[jail_raw] = (
+                    sys.intern(jail) if self.validator.validate_jail_name(jail) else None
+                )
+            if jail is None:
+                return
+            
+            # An IP already in the index was validated by an earlier event
+            ip = ip_raw.decode('ascii')
+            ip_events = log_data['by_ip'].get(ip)
+            if ip_events is None:
+                if not self.validator.validate_ip(ip):
+                    return
+                ip_events = log_data['by_ip'][ip] = {'bans': [], 'unbans': [], 'attempts': []}
+            
+            key = FAIL2BAN_EVENT_KEYS[action]
+            event = {
+                'timestamp': timestamp,
+                'jail': jail,
+                'ip': ip
+            }
+            log_data[key].append(event)
+            ip_events[key].append(event)
+        except Exception:
+            return
+    
     def get_lightweight_email_statistics(self, days: int = 7) -> Dict[str, Any]:
         """Get email statistics with minimal logging and batch processing"""
         if not isinstance(days, int) or days < 1 or days > 30:  # Reduced max from 90
             raise SecurityError("Invalid days parameter for email statistics")
         
-        email_jails = [
-            'postfix-sasl', 'postfix-rbl', 'postfix-relay', 'postfix-spam',
-            'dovecot', 'courier-smtp', 'courier-auth', 'cyrus-imap',
-            'exim', 'exim-spam'
-        ]
-        
         # Process logs in memory without extensive logging
         log_data = self.parse_fail2ban_logs_minimal(days)
         
@@ -719,7 +1041,7 @@ class SimplifiedFail2BanManager:
         
         # Batch process bans for email services (no individual logging)
         for ban in log_data['bans']:
-            if ban['jail'] in email_jails:
+            if ban['jail'] in self.EMAIL_JAILS:
                 email_stats['total_email_attacks'] += 1
                 email_stats['email_bans_by_service'][ban['jail']] += 1
                 email_stats['top_email_attackers'][ban['ip']] += 1
@@ -786,26 +1108,22 @@ class SimplifiedFail2BanManager:
         total_failed = 0
         email_jails = 0
         
+        statuses = self.get_jail_statuses(jails)
         for jail in jails:
-            status = self.get_jail_status(jail)
+            status = statuses[jail]
             if status:
                 currently_failed = status.get('currently_failed', 0)
                 currently_banned = status.get('currently_banned', 0)
                 total_banned_jail = status.get('total_banned', 0)
                 
                 # Categorize jail type
-                jail_type = "🌐"
-                if any(email_keyword in jail.lower() for email_keyword in ['mail', 'smtp', 'imap', 'pop', 'postfix', 'dovecot']):
-                    jail_type = "📧"
+                jail_type = self._jail_type(jail)
+                if jail_type == 'email':
                     email_jails += 1
-                elif 'ssh' in jail.lower():
-                    jail_type = "🔑"
-                elif 'ftp' in jail.lower():
-                    jail_type = "📁"
                 
                 status_icon = "🟢" if currently_banned == 0 else "🔴"
                 
-                print(f"{jail_type} {jail:<17} {status_icon:<10} {currently_failed:<8} {currently_banned:<8} {total_banned_jail:<12}")
+                print(f"{self.JAIL_TYPE_ICONS[jail_type]} {jail:<17} {status_icon:<10} {currently_failed:<8} {currently_banned:<8} {total_banned_jail:<12}")
                 
                 total_banned += currently_banned
                 total_failed += currently_failed
@@ -840,16 +1158,11 @@ class SimplifiedFail2BanManager:
         
         for jail, ips in banned_info.items():
             if ips:
-                jail_type = "🌐"
-                if any(email_keyword in jail.lower() for email_keyword in ['mail', 'smtp', 'imap', 'pop', 'postfix', 'dovecot']):
-                    jail_type = "📧"
+                jail_type = self._jail_type(jail)
+                if jail_type == 'email':
                     email_related_bans += len(ips)
-                elif 'ssh' in jail.lower():
-                    jail_type = "🔑"
-                elif 'ftp' in jail.lower():
-                    jail_type = "📁"
                 
-                print(f"{jail_type} {jail.upper()} Jail ({len(ips)} banned):")
+                print(f"{self.JAIL_TYPE_ICONS[jail_type]} {jail.upper()} Jail ({len(ips)} banned):")
                 for i, ip in enumerate(ips, 1):
                     print(f"  {i:2d}. {ip}")
                 print()
@@ -872,8 +1185,9 @@ class SimplifiedFail2BanManager:
         else:
             jails = self.get_active_jails()
         
+        statuses = self.get_jail_statuses(jails)
         for jail in jails:
-            status = self.get_jail_status(jail)
+            status = statuses[jail]
             if status and 'banned_ips' in status:
                 banned_info[jail] = status['banned_ips']
             else:
@@ -892,9 +1206,11 @@ class SimplifiedFail2BanManager:
             return
         
         all_banned = []
+        ip_to_jails = {}  # ip -> jails currently holding it, for unban by address
         for jail, ips in banned_info.items():
             for ip in ips:
                 all_banned.append((jail, ip))
+                ip_to_jails.setdefault(ip, []).append(jail)
         
         if not all_banned:
             print("✅ No IPs are currently banned.")
@@ -934,7 +1250,8 @@ class SimplifiedFail2BanManager:
                     confirm = input(f"Confirm unban {ip} from ALL jails? (yes/no): ").strip().lower()
                     if confirm in ['yes', 'y']:
                         unbanned = False
-                        for jail in self.get_active_jails():
+                        # Only the jails listing this address, not every active jail
+                        for jail in ip_to_jails.get(ip, []):
                             try:
                                 if self.unban_ip(jail, ip):
                                     unbanned = True
@@ -968,14 +1285,7 @@ class SimplifiedFail2BanManager:
         
         print("Available jails:")
         for i, jail in enumerate(jails, 1):
-            jail_type = "🌐"
-            if any(email_keyword in jail.lower() for email_keyword in ['mail', 'smtp', 'imap', 'pop', 'postfix', 'dovecot']):
-                jail_type = "📧"
-            elif 'ssh' in jail.lower():
-                jail_type = "🔑"
-            elif 'ftp' in jail.lower():
-                jail_type = "📁"
-            print(f"  {i:2d}. {jail_type} {jail}")
+            print(f"  {i:2d}. {self._jail_type_icon(jail)} {jail}")
         
         try:
             jail_num = int(input(f"\nSelect jail (1-{len(jails)}): "))
@@ -988,6 +1298,7 @@ class SimplifiedFail2BanManager:
                     return
                 
                 # Security check for private/local IPs
+                import ipaddress
                 try:
                     ip_obj = ipaddress.ip_address(ip)
                     if ip_obj.is_private or ip_obj.is_loopback:
@@ -1024,8 +1335,9 @@ class SimplifiedFail2BanManager:
         print("=" * 60)
         
         try:
-            today_stats = self.get_daily_statistics(1)
+            # Parse the wider window first so today's figures reuse it
             week_stats = self.get_daily_statistics(7)
+            today_stats = self.get_daily_statistics(1)
             
             print("📅 TODAY'S SECURITY ACTIVITY:")
             print(f"  🚫 Total Bans: {today_stats['total_bans']}")
@@ -1035,12 +1347,7 @@ class SimplifiedFail2BanManager:
             if today_stats['bans_by_jail']:
                 print("\n  📊 Bans by Service:")
                 for jail, count in today_stats['bans_by_jail'].most_common():
-                    jail_type = "🌐"
-                    if any(email_keyword in jail.lower() for email_keyword in ['mail', 'smtp', 'imap', 'pop', 'postfix', 'dovecot']):
-                        jail_type = "📧"
-                    elif 'ssh' in jail.lower():
-                        jail_type = "🔑"
-                    print(f"    {jail_type} {jail}: {count}")
+                    print(f"    {self._jail_type_icon(jail)} {jail}: {count}")
             
             if today_stats['top_attackers']:
                 print(f"\n  🎯 Top Attackers Today:")
@@ -1052,10 +1359,11 @@ class SimplifiedFail2BanManager:
             print(f"  🔍 Failed Attempts: {week_stats['total_attempts']}")
             
             if week_stats['bans_by_jail']:
+                jail_types = {jail: self._jail_type(jail) for jail in week_stats['bans_by_jail']}
                 email_bans = sum(count for jail, count in week_stats['bans_by_jail'].items() 
-                               if any(email_keyword in jail.lower() for email_keyword in ['mail', 'smtp', 'imap', 'pop', 'postfix', 'dovecot']))
+                               if jail_types[jail] == 'email')
                 ssh_bans = sum(count for jail, count in week_stats['bans_by_jail'].items() 
-                             if 'ssh' in jail.lower())
+                             if jail_types[jail] == 'ssh')
                 
                 print(f"\n  📊 Weekly Protection Summary:")
                 print(f"    📧 Email Service Attacks: {email_bans}")
@@ -1076,15 +1384,10 @@ class SimplifiedFail2BanManager:
             'total_bans': len(log_data['bans']),
             'total_unbans': len(log_data['unbans']),
             'total_attempts': len(log_data['attempts']),
-            'bans_by_jail': Counter(),
-            'top_attackers': Counter()
+            'bans_by_jail': Counter(ban['jail'] for ban in log_data['bans']),
+            'top_attackers': Counter(ban['ip'] for ban in log_data['bans'])
         }
         
-        # Process bans
-        for ban in log_data['bans']:
-            stats['bans_by_jail'][ban['jail']] += 1
-            stats['top_attackers'][ban['ip']] += 1
-        
         return stats
     
     def search_ip_interactive(self):
@@ -1128,12 +1431,7 @@ class SimplifiedFail2BanManager:
                 jail_targets = Counter(ban['jail'] for ban in events['bans'])
                 print(f"\n🎯 Targeted Services:")
                 for jail, count in jail_targets.most_common():
-                    jail_type = "🌐"
-                    if any(email_keyword in jail.lower() for email_keyword in ['mail', 'smtp', 'imap', 'pop', 'postfix', 'dovecot']):
-                        jail_type = "📧"
-                    elif 'ssh' in jail.lower():
-                        jail_type = "🔑"
-                    print(f"    {jail_type} {jail}: {count} bans")
+                    print(f"    {self._jail_type_icon(jail)} {jail}: {count} bans")
             
             # Security assessment
             if len(events['bans']) > 5:
@@ -1156,24 +1454,9 @@ class SimplifiedFail2BanManager:
         days = self.validator.validate_time_period(str(days))
         log_data = self.parse_fail2ban_logs_minimal(days)
         
-        ip_events = {
-            'bans': [],
-            'unbans': [],
-            'attempts': []
-        }
-        
-        for ban in log_data['bans']:
-            if ban['ip'] == ip_address:
-                ip_events['bans'].append(ban)
-        
-        for unban in log_data['unbans']:
-            if unban['ip'] == ip_address:
-                ip_events['unbans'].append(unban)
-        
-        for attempt in log_data['attempts']:
-            if attempt['ip'] == ip_address:
-                ip_events['attempts'].append(attempt)
-        
+        ip_events = log_data['by_ip'].get(ip_address)
+        if ip_events is None:
+            return {'bans': [], 'unbans': [], 'attempts': []}
         return ip_events
     
     def export_data_interactive(self):
@@ -1225,39 +1508,21 @@ class SimplifiedFail2BanManager:
         days = self.validator.validate_time_period(str(days))
         log_data = self.parse_fail2ban_logs_minimal(days)
         
+        import csv
         try:
             safe_filename = os.path.join(os.getcwd(), filename)
             
-            with open(safe_filename, 'w', newline='', encoding='utf-8') as csvfile:
+            with open(safe_filename, 'w', newline='', encoding='utf-8',
+                      buffering=self.EXPORT_WRITE_BUFFER_SIZE) as csvfile:
                 writer = csv.writer(csvfile)
                 writer.writerow(['Timestamp', 'Event Type', 'Jail', 'IP Address'])
                 
-                # Write ban events
-                for ban in log_data['bans']:
-                    writer.writerow([
-                        self.format_timestamp(ban['timestamp']),
-                        'BAN',
-                        ban['jail'],
-                        ban['ip']
-                    ])
-                
-                # Write unban events
-                for unban in log_data['unbans']:
-                    writer.writerow([
-                        self.format_timestamp(unban['timestamp']),
-                        'UNBAN',
-                        unban['jail'],
-                        unban['ip']
-                    ])
-                
-                # Write attempt events
-                for attempt in log_data['attempts']:
-                    writer.writerow([
-                        self.format_timestamp(attempt['timestamp']),
-                        'ATTEMPT',
-                        attempt['jail'],
-                        attempt['ip']
-                    ])
+                # Write ban, unban and attempt events in one pass
+                writer.writerows(
+                    (self.format_timestamp(event['timestamp']), event_type, event['jail'], event['ip'])
+                    for key, event_type in (('bans', 'BAN'), ('unbans', 'UNBAN'), ('attempts', 'ATTEMPT'))
+                    for event in log_data[key]
+                )
             
             # Set secure permissions
             os.chmod(safe_filename, 0o640)
@@ -1268,30 +1533,17 @@ class SimplifiedFail2BanManager:
     
     def format_timestamp(self, timestamp: datetime) -> str:
         """Format timestamp for display"""
-        return timestamp.strftime('%Y-%m-%d %H:%M:%S')
+        # Same output as strftime('%Y-%m-%d %H:%M:%S'), without the format-string parse
+        return timestamp.isoformat(sep=' ', timespec='seconds')
+    
+    @cached_property
+    def _menu_title(self) -> str:
+        """Figlet banner for the menu, rendered once instead of on every redraw"""
+        return pyfiglet.figlet_format("SimplifiedF2B", font="small")
     
     def show_menu(self):
         """Display the simplified main menu"""
-        title = pyfiglet.figlet_format("SimplifiedF2B", font="small")
-        print(title)
-        print("🛡️ Simplified Secure Fail2Ban Manager v3.0 - Production Safe")
-        print("=" * 60)
-        print()
-        print("  1.  Show jail status overview")
-        print("  2.  List all banned IPs")
-        print("  3.  Unban specific IP")
-        print("  4.  Ban specific IP manually")
-        print("  5.  Daily/Weekly security activity report")
-        print("  6.  Search IP across logs")
-        print("  7.  📧 Lightweight Email Security Report")
-        print("  8.  Export ban data to CSV")
-        print("  s.  Show security audit log")
-        print("  d.  Debug jail status")
-        print("")
-        print("  x.  Exit and cleanup session")
-        print()
-        print("🔒 Security: Minimal logging, aggressive cleanup")
-        print()
+        sys.stdout.write(self._menu_title + "\n" + self.MENU_TEXT)
     
     def show_security_audit_log(self):
         """Display recent security audit log entries"""
@@ -1299,6 +1551,7 @@ class SimplifiedFail2BanManager:
         print("=" * 60)
         
         try:
+            self.auditor.flush()
             if self.auditor.log_file and self.auditor.log_file.exists():
                 # Read last 20 lines of audit log (reduced from 50)
                 result = subprocess.run(
@@ -1334,72 +1587,61 @@ class SimplifiedFail2BanManager:
             print(f"❌ Failed to initialize: {e}")
             return
         
-        while True:
-            try:
-                self.show_menu()
-                choice = input("Choose an option (1-8, s, d, x): ").strip().lower()
-                
-                if choice == '1':
-                    self.show_jail_status_overview()
-                
-                elif choice == '2':
-                    self.show_banned_ips_detailed()
-                
-                elif choice == '3':
-                    try:
-                        self.unban_ip_interactive()
-                    except SecurityError as e:
-                        print(f"🔒 Security restriction: {e}")
-                
-                elif choice == '4':
-                    try:
-                        self.ban_ip_interactive()
-                    except SecurityError as e:
-                        print(f"🔒 Security restriction: {e}")
-                
-                elif choice == '5':
-                    self.show_daily_report()
-                
-                elif choice == '6':
-                    self.search_ip_interactive()
-                
-                elif choice == '7':
-                    self.show_lightweight_email_security_report()
-                
-                elif choice == '8':
-                    try:
-                        self.export_data_interactive()
-                    except SecurityError as e:
-                        print(f"🔒 Security restriction: {e}")
-                
-                elif choice == 's':
-                    self.show_security_audit_log()
+        # Piped stdin (ops scripts feeding e.g. "3\n2\n1.2.3.4\nyes\nx") gets no menu redraws
+        interactive = sys.stdin.isatty()
+        
+        try:
+            while True:
+                try:
+                    choice = self._read_menu_choice(interactive)
+                except (EOFError, KeyboardInterrupt):
+                    self._close_session_interactive()
+                    break
                 
-                elif choice == 'd':
-                    self.debug_jail_status()
+                if choice not in self.MENU_CHOICES:
+                    print("❌ Invalid choice. Please enter 1-8, s, d, or x.")
+                    continue
                 
-                elif choice == 'x':
+                if choice == 'x':
                     print("🔒 Closing session and cleaning up...")
                     self.auditor.cleanup_session()
                     print("👋 Goodbye!")
                     break
                 
-                else:
-                    print("❌ Invalid choice. Please enter 1-8, s, d, or x.")
-                    
-            except KeyboardInterrupt:
-                print("\n\n🔒 Closing session and cleaning up...")
-                self.auditor.cleanup_session()
-                print("👋 Goodbye!")
-                break
-            except SecurityError as e:
-                print(f"🔒 Security Error: {e}")
-                self.auditor.log_critical_event("SECURITY_VIOLATION", str(e))
-            except Exception as e:
-                print(f"❌ Unexpected error: {e}")
-                
-        # Final cleanup
-        self._final_cleanup()
+                action = getattr(self, self.MENU_ACTIONS[choice])
+                try:
+                    action()
+                except (EOFError, KeyboardInterrupt):
+                    self._close_session_interactive()
+                    break
+                except SecurityError as e:
+                    if choice in self.RESTRICTED_MENU_ACTIONS:
+                        print(f"🔒 Security restriction: {e}")
+                    else:
+                        print(f"🔒 Security Error: {e}")
+                        self.auditor.log_critical_event("SECURITY_VIOLATION", str(e))
+                except (OSError, subprocess.SubprocessError) as e:
+                    print(f"❌ Unexpected error: {e}")
+        finally:
+            # Final cleanup, also when an unexpected error escapes to main()
+            self._final_cleanup()
+    
+    def _read_menu_choice(self, interactive: bool) -> str:
+        """Show the menu and prompt on a terminal; otherwise take the next scripted command"""
+        if interactive:
+            self.show_menu()
+            return input("Choose an option (1-8, s, d, x): ").strip().lower()
+        
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.strip().lower()
+    
+    def _close_session_interactive(self):
+        """Close the session after Ctrl-C or end of input"""
+        print("\n\n🔒 Closing session and cleaning up...")
+        self.auditor.cleanup_session()
+        print("👋 Goodbye!")
     
     def _final_cleanup(self):
         """Final aggressive cleanup"""